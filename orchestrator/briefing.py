@@ -4,12 +4,40 @@ Daily Brief Generator
 Generates daily status briefs for team communication.
 """
 
+import io
 from dataclasses import dataclass
 from typing import List, Optional
 from datetime import datetime, timedelta
 
 
-@dataclass
+# Fixed brief chrome; only the date and stats are filled in per brief
+_SLACK_HEADER = """*🤖 Pilot Daily Brief - {date}*
+
+📊 *Summary*
+• Completed: {completed_count}
+• In Progress: {in_progress_count}
+• Failed: {failed_count}
+• Upcoming: {upcoming_count}
+• Success Rate: {success_rate:.0f}%
+
+"""
+
+_MARKDOWN_HEADER = """# Pilot Daily Brief - {date}
+
+## Summary
+
+| Metric | Count |
+|--------|-------|
+| Completed | {completed_count} |
+| In Progress | {in_progress_count} |
+| Failed | {failed_count} |
+| Upcoming | {upcoming_count} |
+| Success Rate | {success_rate:.0f}% |
+
+"""
+
+
+@dataclass(slots=True)
 class TaskSummary:
     """Summary of a task for the brief."""
     id: str
@@ -20,7 +48,7 @@ class TaskSummary:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyBrief:
     """Daily status brief."""
     date: datetime
@@ -42,24 +70,33 @@ class BriefGenerator:
         """Generate a daily brief from task list."""
         date = date or datetime.now()
 
-        # Categorize tasks
-        completed = [t for t in tasks if t.status == 'completed']
-        in_progress = [t for t in tasks if t.status == 'running']
-        failed = [t for t in tasks if t.status == 'failed']
-        upcoming = [t for t in tasks if t.status == 'pending']
+        # Categorize tasks in a single pass
+        completed: List[TaskSummary] = []
+        in_progress: List[TaskSummary] = []
+        failed: List[TaskSummary] = []
+        upcoming: List[TaskSummary] = []
+        buckets = {
+            'completed': completed.append,
+            'running': in_progress.append,
+            'failed': failed.append,
+            'pending': upcoming.append,
+        }
+        for t in tasks:
+            append = buckets.get(t.status)
+            if append is not None:
+                append(t)
 
         # Calculate stats
+        n_completed = len(completed)
+        n_failed = len(failed)
+        finished = n_completed + n_failed
         stats = {
             'total': len(tasks),
-            'completed_count': len(completed),
+            'completed_count': n_completed,
             'in_progress_count': len(in_progress),
-            'failed_count': len(failed),
+            'failed_count': n_failed,
             'upcoming_count': len(upcoming),
-            'success_rate': (
-                len(completed) / (len(completed) + len(failed)) * 100
-                if (len(completed) + len(failed)) > 0
-                else 0
-            ),
+            'success_rate': n_completed / finished * 100 if finished > 0 else 0,
         }
 
         return DailyBrief(
@@ -75,96 +112,102 @@ class BriefGenerator:
         """Format brief as Slack message."""
         date_str = brief.date.strftime('%B %d, %Y')
 
-        msg = f"*🤖 Pilot Daily Brief - {date_str}*\n\n"
+        parts: List[str] = []
+        append = parts.append
 
-        # Stats summary
-        msg += f"📊 *Summary*\n"
-        msg += f"• Completed: {brief.stats['completed_count']}\n"
-        msg += f"• In Progress: {brief.stats['in_progress_count']}\n"
-        msg += f"• Failed: {brief.stats['failed_count']}\n"
-        msg += f"• Upcoming: {brief.stats['upcoming_count']}\n"
-        msg += f"• Success Rate: {brief.stats['success_rate']:.0f}%\n\n"
+        # Header and stats summary
+        append(_SLACK_HEADER.format(date=date_str, **brief.stats))
 
         # Completed tasks
         if brief.completed:
-            msg += "✅ *Completed*\n"
+            append("✅ *Completed*\n")
             for task in brief.completed[:5]:
                 pr_link = f" (<{task.pr_url}|PR>)" if task.pr_url else ""
-                msg += f"• `{task.id}` {task.title}{pr_link}\n"
+                append(f"• `{task.id}` {task.title}{pr_link}\n")
             if len(brief.completed) > 5:
-                msg += f"  _...and {len(brief.completed) - 5} more_\n"
-            msg += "\n"
+                append(f"  _...and {len(brief.completed) - 5} more_\n")
+            append("\n")
 
         # In progress
         if brief.in_progress:
-            msg += "⏳ *In Progress*\n"
+            append("⏳ *In Progress*\n")
             for task in brief.in_progress[:5]:
-                msg += f"• `{task.id}` {task.title}\n"
-            msg += "\n"
+                append(f"• `{task.id}` {task.title}\n")
+            append("\n")
 
         # Failed tasks
         if brief.failed:
-            msg += "❌ *Failed (needs attention)*\n"
+            append("❌ *Failed (needs attention)*\n")
             for task in brief.failed[:3]:
                 error = f": {task.error[:50]}..." if task.error else ""
-                msg += f"• `{task.id}` {task.title}{error}\n"
-            msg += "\n"
+                append(f"• `{task.id}` {task.title}{error}\n")
+            append("\n")
 
         # Upcoming
         if brief.upcoming:
-            msg += "📋 *Next Up*\n"
+            append("📋 *Next Up*\n")
             for task in brief.upcoming[:3]:
-                msg += f"• `{task.id}` {task.title}\n"
+                append(f"• `{task.id}` {task.title}\n")
+
+        return "".join(parts)
+
+    def to_markdown(self, brief: DailyBrief, max_items: int = 200) -> str:
+        """
+        Format brief as Markdown.
 
-        return msg
+        Each task section lists at most `max_items` entries, followed by a
+        count of the remaining ones.
+        """
+        if max_items < 0:
+            raise ValueError(f"max_items must be non-negative, got {max_items}")
 
-    def to_markdown(self, brief: DailyBrief) -> str:
-        """Format brief as Markdown."""
         date_str = brief.date.strftime('%B %d, %Y')
 
-        md = f"# Pilot Daily Brief - {date_str}\n\n"
+        buf = io.StringIO()
+        write = buf.write
 
-        # Stats
-        md += "## Summary\n\n"
-        md += f"| Metric | Count |\n"
-        md += f"|--------|-------|\n"
-        md += f"| Completed | {brief.stats['completed_count']} |\n"
-        md += f"| In Progress | {brief.stats['in_progress_count']} |\n"
-        md += f"| Failed | {brief.stats['failed_count']} |\n"
-        md += f"| Upcoming | {brief.stats['upcoming_count']} |\n"
-        md += f"| Success Rate | {brief.stats['success_rate']:.0f}% |\n\n"
+        # Header and stats table
+        write(_MARKDOWN_HEADER.format(date=date_str, **brief.stats))
 
         # Completed
         if brief.completed:
-            md += "## ✅ Completed\n\n"
-            for task in brief.completed:
+            write("## ✅ Completed\n\n")
+            for task in brief.completed[:max_items]:
                 pr_link = f" - [PR]({task.pr_url})" if task.pr_url else ""
-                md += f"- **{task.id}**: {task.title}{pr_link}\n"
-            md += "\n"
+                write(f"- **{task.id}**: {task.title}{pr_link}\n")
+            if len(brief.completed) > max_items:
+                write(f"\n_...and {len(brief.completed) - max_items} more_\n")
+            write("\n")
 
         # In Progress
         if brief.in_progress:
-            md += "## ⏳ In Progress\n\n"
-            for task in brief.in_progress:
-                md += f"- **{task.id}**: {task.title}\n"
-            md += "\n"
+            write("## ⏳ In Progress\n\n")
+            for task in brief.in_progress[:max_items]:
+                write(f"- **{task.id}**: {task.title}\n")
+            if len(brief.in_progress) > max_items:
+                write(f"\n_...and {len(brief.in_progress) - max_items} more_\n")
+            write("\n")
 
         # Failed
         if brief.failed:
-            md += "## ❌ Failed\n\n"
-            for task in brief.failed:
-                md += f"- **{task.id}**: {task.title}\n"
+            write("## ❌ Failed\n\n")
+            for task in brief.failed[:max_items]:
+                write(f"- **{task.id}**: {task.title}\n")
                 if task.error:
-                    md += f"  - Error: {task.error}\n"
-            md += "\n"
+                    write(f"  - Error: {task.error}\n")
+            if len(brief.failed) > max_items:
+                write(f"\n_...and {len(brief.failed) - max_items} more_\n")
+            write("\n")
 
         # Upcoming
         if brief.upcoming:
-            md += "## 📋 Upcoming\n\n"
-            for task in brief.upcoming:
-                md += f"- **{task.id}**: {task.title}\n"
+            write("## 📋 Upcoming\n\n")
+            for task in brief.upcoming[:max_items]:
+                write(f"- **{task.id}**: {task.title}\n")
+            if len(brief.upcoming) > max_items:
+                write(f"\n_...and {len(brief.upcoming) - max_items} more_\n")
 
-        return md
+        return buf.getvalue()
 
 
 def generate_brief(tasks_data: List[dict], format: str = "slack") -> str:
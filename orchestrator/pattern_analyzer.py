@@ -5,13 +5,15 @@ Uses LLM to extract meaningful patterns from execution outputs.
 Designed to identify code patterns, anti-patterns, and workflow patterns.
 """
 
+import bisect
 import json
 import sys
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any
+from itertools import accumulate
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Set
 
 
-@dataclass
+@dataclass(slots=True)
 class Pattern:
     """Represents an extracted pattern."""
     type: str  # code, structure, naming, workflow, error
@@ -22,7 +24,7 @@ class Pattern:
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Result of pattern analysis."""
     patterns: List[Pattern]
@@ -123,23 +125,43 @@ class PatternAnalyzer:
         patterns = []
         anti_patterns = []
 
-        # Analyze output for code patterns
+        # Analyze output for code patterns, skipping titles already matched
         combined_text = f"{output}\n{diff_content}"
+        combined_lc = combined_text.lower()
+        # Line index for example extraction, built on the first match
+        lines: Optional[List[str]] = None
+        line_starts: List[int] = []
+        seen_titles: Set[str] = set()
         for pattern_def in self.CODE_PATTERNS:
-            if pattern_def["signature"].lower() in combined_text.lower():
+            if pattern_def["title"] in seen_titles:
+                continue
+            sig_lc = pattern_def["signature"].lower()
+            if sig_lc in combined_lc:
+                seen_titles.add(pattern_def["title"])
+                if lines is None:
+                    lines = combined_text.split("\n")
+                    line_starts = list(accumulate(
+                        (len(line) + 1 for line in combined_lc.split("\n")),
+                        initial=0,
+                    ))
                 patterns.append(Pattern(
                     type=pattern_def["type"],
                     title=pattern_def["title"],
                     description=pattern_def["description"],
                     context=pattern_def["context"],
-                    examples=self._extract_examples(combined_text, pattern_def["signature"]),
+                    examples=self._extract_examples(combined_lc, lines, line_starts, sig_lc),
                     confidence=0.7,
                 ))
 
         # Analyze errors for anti-patterns
         if error:
+            error_lc = error.lower()
+            seen_titles = set()
             for pattern_def in self.ERROR_PATTERNS:
-                if pattern_def["signature"].lower() in error.lower():
+                if pattern_def["title"] in seen_titles:
+                    continue
+                if pattern_def["signature"].lower() in error_lc:
+                    seen_titles.add(pattern_def["title"])
                     anti_patterns.append(Pattern(
                         type=pattern_def["type"],
                         title=pattern_def["title"],
@@ -149,42 +171,53 @@ class PatternAnalyzer:
                         confidence=0.8,
                     ))
 
-        # Deduplicate patterns
-        patterns = self._deduplicate_patterns(patterns)
-        anti_patterns = self._deduplicate_patterns(anti_patterns)
-
         return AnalysisResult(patterns=patterns, anti_patterns=anti_patterns)
 
-    def _extract_examples(self, text: str, signature: str) -> List[str]:
-        """Extract example snippets containing the signature."""
+    def _extract_examples(
+        self,
+        text_lc: str,
+        lines: List[str],
+        line_starts: List[int],
+        sig_lc: str,
+    ) -> List[str]:
+        """
+        Extract example snippets containing the lowercased signature.
+
+        Jumps between occurrences with str.find rather than testing every
+        line, mapping each hit back to its line via line_starts (the offset
+        of each line in text_lc, plus a trailing end-of-text sentinel).
+        """
         examples = []
-        lines = text.split("\n")
+        pos = 0
 
-        for i, line in enumerate(lines):
-            if signature.lower() in line.lower():
-                # Get surrounding context
-                start = max(0, i - 1)
-                end = min(len(lines), i + 2)
-                snippet = "\n".join(lines[start:end])
-                if len(snippet) <= 200:
-                    examples.append(snippet)
+        while len(examples) < 3:
+            pos = text_lc.find(sig_lc, pos)
+            if pos < 0:
+                break
 
-                if len(examples) >= 3:
-                    break
+            # Get surrounding context
+            i = bisect.bisect_right(line_starts, pos) - 1
+            snippet = "\n".join(lines[max(0, i - 1):i + 2])
+            if len(snippet) <= 200:
+                examples.append(snippet)
 
-        return examples
+            if i + 1 >= len(line_starts):
+                break
+            pos = line_starts[i + 1]
 
-    def _deduplicate_patterns(self, patterns: List[Pattern]) -> List[Pattern]:
-        """Remove duplicate patterns based on title."""
-        seen = set()
-        unique = []
+        return examples
 
-        for p in patterns:
-            if p.title not in seen:
-                seen.add(p.title)
-                unique.append(p)
 
-        return unique
+def _pattern_to_dict(p: Pattern) -> Dict[str, Any]:
+    """Convert a pattern to a JSON-ready dict without asdict's deep copy."""
+    return {
+        "type": p.type,
+        "title": p.title,
+        "description": p.description,
+        "context": p.context,
+        "examples": p.examples,
+        "confidence": p.confidence,
+    }
 
 
 def analyze_patterns(request_json: str) -> str:
@@ -202,8 +235,8 @@ def analyze_patterns(request_json: str) -> str:
     result = analyzer.analyze(request)
 
     return json.dumps({
-        "patterns": [asdict(p) for p in result.patterns],
-        "anti_patterns": [asdict(p) for p in result.anti_patterns],
+        "patterns": [_pattern_to_dict(p) for p in result.patterns],
+        "anti_patterns": [_pattern_to_dict(p) for p in result.anti_patterns],
     })
 
 
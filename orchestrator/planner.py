@@ -5,12 +5,22 @@ Converts tickets from Linear/Jira into Navigator task documents.
 """
 
 import json
+import re
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 
-@dataclass
+# Bullet ("- ", "* ") or checkbox ("[ ]", "[x]") lines; captures the item text.
+# [^\S\n] is horizontal whitespace, so matches never span lines. The
+# possessive quantifiers stop whitespace runs from backtracking into (.*\S).
+_REQUIREMENT_RE = re.compile(
+    r'^[^\S\n]*+(?:[-*] |\[[x ]\])[^\S\n]*+(.*\S)[^\S\n]*$',
+    re.MULTILINE,
+)
+
+
+@dataclass(slots=True)
 class Ticket:
     """Represents a ticket from a project management tool."""
     id: str
@@ -24,7 +34,7 @@ class Ticket:
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a Navigator task document."""
     id: str
@@ -74,16 +84,7 @@ class TaskPlanner:
 
     def _extract_requirements(self, description: str) -> List[str]:
         """Extract requirements from ticket description."""
-        requirements = []
-        lines = description.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if line.startswith('- ') or line.startswith('* '):
-                requirements.append(line[2:])
-            elif line.startswith('[ ]') or line.startswith('[x]'):
-                requirements.append(line[4:].strip())
-
+        requirements = _REQUIREMENT_RE.findall(description)
         return requirements if requirements else [description[:200]]
 
     def _generate_acceptance_criteria(self, ticket: Ticket) -> List[str]:
@@ -110,8 +111,14 @@ class TaskPlanner:
         else:
             return "low"
 
-    def to_markdown(self, task: Task) -> str:
-        """Convert task to Navigator markdown format."""
+    def to_markdown(self, task: Task, created_at: Optional[str] = None) -> str:
+        """
+        Convert task to Navigator markdown format.
+
+        Pass a preformatted `created_at` timestamp to share one clock
+        reading across a batch of tasks; defaults to the current time.
+        """
+        created_at = created_at or datetime.now().isoformat()
         requirements = '\n'.join(f"- {r}" for r in task.requirements)
         criteria = '\n'.join(f"- [ ] {c}" for c in task.acceptance_criteria)
 
@@ -135,7 +142,7 @@ class TaskPlanner:
 ## Metadata
 - **Priority**: {task.priority}
 - **Complexity**: {task.estimated_complexity}
-- **Created**: {datetime.now().isoformat()}
+- **Created**: {created_at}
 """
 
 
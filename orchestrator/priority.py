@@ -9,7 +9,23 @@ from typing import List, Optional
 from datetime import datetime, timedelta
 
 
-@dataclass
+# Weight factors
+WEIGHTS = {
+    'base_priority': 0.4,
+    'age': 0.2,
+    'complexity': 0.15,
+    'dependencies': 0.15,
+    'labels': 0.1,
+}
+
+# Priority labels that boost score
+URGENT_LABELS = {'urgent', 'critical', 'blocker', 'hotfix'}
+
+# Complexity factor (simpler tasks slightly preferred)
+COMPLEXITY_SCORES = {'low': 80, 'medium': 50, 'high': 30}
+
+
+@dataclass(slots=True)
 class ScoredTask:
     """A task with priority score."""
     task_id: str
@@ -22,17 +38,8 @@ class ScoredTask:
 class PriorityScorer:
     """Calculates priority scores for tasks."""
 
-    # Weight factors
-    WEIGHTS = {
-        'base_priority': 0.4,
-        'age': 0.2,
-        'complexity': 0.15,
-        'dependencies': 0.15,
-        'labels': 0.1,
-    }
-
-    # Priority labels that boost score
-    URGENT_LABELS = {'urgent', 'critical', 'blocker', 'hotfix'}
+    WEIGHTS = WEIGHTS
+    URGENT_LABELS = URGENT_LABELS
 
     def score_task(
         self,
@@ -43,47 +50,45 @@ class PriorityScorer:
         complexity: str = "medium",
         labels: Optional[List[str]] = None,
         blocking_count: int = 0,
+        now: Optional[datetime] = None,
     ) -> ScoredTask:
         """
         Calculate priority score for a task.
 
-        Higher score = higher priority.
+        Higher score = higher priority. Pass `now` when scoring a batch so
+        every task's age is measured against the same clock reading.
         """
-        factors = {}
-
         # Base priority score (1-4 maps to 100-25)
-        base_score = max(0, (5 - priority) * 25)
-        factors['base_priority'] = base_score
+        base_score = (5 - priority) * 25
+        if base_score < 0:
+            base_score = 0
 
         # Age factor (older tasks get slight boost)
         if created_at:
-            age_days = (datetime.now() - created_at).days
-            age_score = min(100, age_days * 5)  # Max 100 at 20 days
+            now = now or datetime.now()
+            age_days = (now - created_at).days
+            age_score = age_days * 5 if age_days < 20 else 100  # Max 100 at 20 days
         else:
             age_score = 0
-        factors['age'] = age_score
 
         # Complexity factor (simpler tasks slightly preferred)
-        complexity_scores = {'low': 80, 'medium': 50, 'high': 30}
-        complexity_score = complexity_scores.get(complexity, 50)
-        factors['complexity'] = complexity_score
+        complexity_score = COMPLEXITY_SCORES.get(complexity, 50)
 
         # Dependencies (tasks blocking others get priority)
-        dependency_score = min(100, blocking_count * 20)
-        factors['dependencies'] = dependency_score
+        dependency_score = blocking_count * 20 if blocking_count < 5 else 100
 
         # Label boost
-        label_score = 0
-        if labels:
-            label_set = set(l.lower() for l in labels)
-            if label_set & self.URGENT_LABELS:
-                label_score = 100
-        factors['labels'] = label_score
-
-        # Calculate weighted score
-        total_score = sum(
-            factors[k] * self.WEIGHTS[k]
-            for k in self.WEIGHTS
+        urgent_labels = self.URGENT_LABELS
+        label_score = 100 if labels and any(l.lower() in urgent_labels for l in labels) else 0
+
+        # Calculate weighted score (unrolled over WEIGHTS)
+        weights = self.WEIGHTS
+        total_score = (
+            base_score * weights['base_priority']
+            + age_score * weights['age']
+            + complexity_score * weights['complexity']
+            + dependency_score * weights['dependencies']
+            + label_score * weights['labels']
         )
 
         return ScoredTask(
@@ -91,7 +96,13 @@ class PriorityScorer:
             title=title,
             raw_priority=priority,
             score=round(total_score, 2),
-            factors=factors,
+            factors={
+                'base_priority': base_score,
+                'age': age_score,
+                'complexity': complexity_score,
+                'dependencies': dependency_score,
+                'labels': label_score,
+            },
         )
 
     def rank_tasks(self, tasks: List[ScoredTask]) -> List[ScoredTask]:
@@ -110,12 +121,13 @@ def score_tasks(tasks_data: List[dict]) -> List[dict]:
         List of scored tasks sorted by priority
     """
     scorer = PriorityScorer()
-    scored = []
+    scored: List[ScoredTask] = []
+    scores: List[float] = []
+    now = datetime.now()
 
     for task in tasks_data:
-        created_at = None
-        if task.get('created_at'):
-            created_at = datetime.fromisoformat(task['created_at'])
+        raw_created_at = task.get('created_at')
+        created_at = datetime.fromisoformat(raw_created_at) if raw_created_at else None
 
         scored_task = scorer.score_task(
             task_id=task.get('id', ''),
@@ -125,17 +137,25 @@ def score_tasks(tasks_data: List[dict]) -> List[dict]:
             complexity=task.get('complexity', 'medium'),
             labels=task.get('labels', []),
             blocking_count=task.get('blocking_count', 0),
+            now=now,
         )
 
-        scored.append({
-            'task_id': scored_task.task_id,
-            'title': scored_task.title,
-            'raw_priority': scored_task.raw_priority,
-            'score': scored_task.score,
-            'factors': scored_task.factors,
-        })
+        scored.append(scored_task)
+        scores.append(scored_task.score)
+
+    # Rank by the flat score list, then build output dicts in final order
+    order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
 
-    return sorted(scored, key=lambda t: t['score'], reverse=True)
+    return [
+        {
+            'task_id': scored[i].task_id,
+            'title': scored[i].title,
+            'raw_priority': scored[i].raw_priority,
+            'score': scored[i].score,
+            'factors': scored[i].factors,
+        }
+        for i in order
+    ]
 
 
 if __name__ == "__main__":
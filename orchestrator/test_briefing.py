@@ -0,0 +1,37 @@
+"""Tests for daily brief formatting."""
+
+import pytest
+
+from briefing import BriefGenerator, TaskSummary, generate_brief
+
+
+def _brief(count, status='completed'):
+    tasks = [TaskSummary(id=f'T-{i}', title=f'Task {i}', status=status) for i in range(count)]
+    return BriefGenerator().generate(tasks)
+
+
+def test_markdown_truncates_sections_with_footer():
+    md = BriefGenerator().to_markdown(_brief(5, 'failed'), max_items=2)
+
+    assert md.count('- **T-') == 2
+    assert '_...and 3 more_' in md
+
+
+def test_markdown_lists_all_items_within_limit():
+    md = BriefGenerator().to_markdown(_brief(3), max_items=3)
+
+    assert md.count('- **T-') == 3
+    assert 'more_' not in md
+
+
+def test_markdown_default_limit_is_200():
+    tasks = [{'id': f'T-{i}', 'title': 't', 'status': 'pending'} for i in range(205)]
+    md = generate_brief(tasks, 'markdown')
+
+    assert md.count('- **T-') == 200
+    assert '_...and 5 more_' in md
+
+
+def test_markdown_rejects_negative_limit():
+    with pytest.raises(ValueError):
+        BriefGenerator().to_markdown(_brief(5), max_items=-1)
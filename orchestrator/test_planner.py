@@ -0,0 +1,50 @@
+"""Tests for requirement extraction in the task planner."""
+
+import time
+
+import pytest
+
+from planner import TaskPlanner
+
+
+@pytest.fixture
+def planner():
+    return TaskPlanner()
+
+
+def test_extracts_bullets_and_checkboxes(planner):
+    description = "Intro\n- one\n* two\n[ ] three\n[x] four\n"
+    assert planner._extract_requirements(description) == ["one", "two", "three", "four"]
+
+
+def test_indented_bullets_are_extracted(planner):
+    description = "  - nested\n\t* tabbed indent"
+    assert planner._extract_requirements(description) == ["nested", "tabbed indent"]
+
+
+def test_bullet_requires_space_separator(planner):
+    assert planner._extract_requirements("-\tfoo\n-bar\n- baz") == ["baz"]
+
+
+def test_extra_whitespace_is_stripped(planner):
+    assert planner._extract_requirements("-   spaced   \r\n") == ["spaced"]
+
+
+def test_checkbox_without_space_keeps_first_char(planner):
+    assert planner._extract_requirements("[x]item") == ["item"]
+
+
+def test_empty_checkbox_is_skipped(planner):
+    assert planner._extract_requirements("[ ]\n[x] done") == ["done"]
+
+
+def test_falls_back_to_truncated_description(planner):
+    description = "No list here. " * 30
+    assert planner._extract_requirements(description) == [description[:200]]
+
+
+def test_whitespace_after_marker_is_linear(planner):
+    padded = "- " + " " * 50_000 + "\n[ ]" + "\t" * 50_000 + "\n"
+    start = time.perf_counter()
+    assert planner._extract_requirements(padded) == [padded[:200]]
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,20 @@
+"""Tests for priority scoring."""
+
+from priority import PriorityScorer
+
+
+def test_subclass_weights_and_labels_override_defaults():
+    class BaseOnlyScorer(PriorityScorer):
+        WEIGHTS = {
+            'base_priority': 1.0,
+            'age': 0.0,
+            'complexity': 0.0,
+            'dependencies': 0.0,
+            'labels': 0.0,
+        }
+        URGENT_LABELS = {'p0'}
+
+    scored = BaseOnlyScorer().score_task('T-1', 'Fix', priority=1, labels=['P0'])
+
+    assert scored.score == 100.0
+    assert scored.factors['labels'] == 100